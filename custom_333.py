@@ -9,9 +9,13 @@ Game Structure:
 """
 
 import numpy as np
+from typing import Tuple
 from three_player_nash import ThreePlayerGame
 
 
+GAME_SHAPE = (2, 4, 2)
+
+
 def input_escalation_game():
     """
     Input game payoffs in the format shown in the PDF.
@@ -176,11 +180,63 @@ def use_pdf_example():
     return payoffs_p1, payoffs_p2, payoffs_p3
 
 
+def _check_payoff_shapes(payoffs_p1, payoffs_p2, payoffs_p3):
+    """Ensure all three payoff tensors have the 2x4x2 game shape."""
+    for name, p in (("p1", payoffs_p1), ("p2", payoffs_p2), ("p3", payoffs_p3)):
+        if p.shape != GAME_SHAPE:
+            raise ValueError(f"Payoffs '{name}' have shape {p.shape}, expected {GAME_SHAPE}")
+    return payoffs_p1, payoffs_p2, payoffs_p3
+
+
+def load_payoffs_from_npz(path: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Load all payoffs in one shot from a .npz archive.
+    
+    The archive must hold arrays 'p1', 'p2', 'p3', each of shape (2, 4, 2),
+    e.g. written with np.savez(path, p1=payoffs_p1, p2=payoffs_p2, p3=payoffs_p3).
+    """
+    with np.load(path) as d:
+        return _check_payoff_shapes(
+            np.asarray(d['p1'], dtype=float),
+            np.asarray(d['p2'], dtype=float),
+            np.asarray(d['p3'], dtype=float),
+        )
+
+
+def load_payoffs_from_yaml(path: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Load all payoffs in one shot from a YAML file (requires PyYAML).
+    
+    The file must map 'p1', 'p2', 'p3' to nested lists indexed
+    [p1_strategy][p2_strategy][p3_strategy], i.e. shape (2, 4, 2).
+    """
+    try:
+        import yaml
+    except ImportError as e:
+        raise ImportError("Loading payoffs from YAML requires PyYAML (pip install pyyaml)") from e
+    
+    with open(path, 'r') as f:
+        d = yaml.safe_load(f)
+    return _check_payoff_shapes(
+        np.asarray(d['p1'], dtype=float),
+        np.asarray(d['p2'], dtype=float),
+        np.asarray(d['p3'], dtype=float),
+    )
+
+
+def load_payoffs_from_file(path: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Load payoffs from a .npz or .yaml/.yml file, chosen by extension."""
+    ext = path.lower()
+    if ext.endswith(('.yaml', '.yml')):
+        return load_payoffs_from_yaml(path)
+    if ext.endswith('.npz'):
+        return load_payoffs_from_npz(path)
+    raise ValueError(f"unsupported payoff file extension: {path}")
+
+
 def display_game_tables(payoffs_p1, payoffs_p2, payoffs_p3):
     """Display the game in the PDF table format."""
-    print("\n" + "="*80)
-    print("GAME PAYOFF TABLES")
-    print("="*80)
+    lines = ["\n" + "="*80, "GAME PAYOFF TABLES", "="*80]
     
     p1_labels = ["Escalate", "Deescalate"]
     p3_labels = ["Escalate", "Deescalate"]
@@ -191,27 +247,26 @@ def display_game_tables(payoffs_p1, payoffs_p2, payoffs_p3):
         "D-P3 & D-P1"
     ]
     
+    # Header is the same for every Player 3 strategy
+    header = f"\n{'Player 1':<15}" + "".join(f"{label:<18}" for label in p2_labels)
+    
+    # Reorder each cube to [p3][p1][p2] once so rows are plain lists
+    t1, t2, t3 = (np.asarray(p).transpose(2, 0, 1).tolist()
+                  for p in (payoffs_p1, payoffs_p2, payoffs_p3))
+    
     for p3_idx in range(2):
-        print(f"\n{'='*80}")
-        print(f"PLAYER 3: {p3_labels[p3_idx].upper()}")
-        print("="*80)
-        
-        # Header
-        print(f"\n{'Player 1':<15}", end="")
-        for p2_idx in range(4):
-            print(f"{p2_labels[p2_idx]:<18}", end="")
-        print()
-        print("-" * 80)
+        lines += [f"\n{'='*80}", f"PLAYER 3: {p3_labels[p3_idx].upper()}", "="*80]
+        lines += [header, "-" * 80]
         
         # Rows
         for p1_idx in range(2):
-            print(f"{p1_labels[p1_idx]:<15}", end="")
-            for p2_idx in range(4):
-                p1_pay = payoffs_p1[p1_idx, p2_idx, p3_idx]
-                p2_pay = payoffs_p2[p1_idx, p2_idx, p3_idx]
-                p3_pay = payoffs_p3[p1_idx, p2_idx, p3_idx]
-                print(f"({p1_pay:>4.1f},{p2_pay:>4.1f},{p3_pay:>4.1f})", end="  ")
-            print()
+            cells = "".join(
+                f"({a:>4.1f},{b:>4.1f},{c:>4.1f})  "
+                for a, b, c in zip(t1[p3_idx][p1_idx], t2[p3_idx][p1_idx], t3[p3_idx][p1_idx])
+            )
+            lines.append(f"{p1_labels[p1_idx]:<15}" + cells)
+    
+    print("\n".join(lines))
 
 
 def analyze_game(payoffs_p1, payoffs_p2, payoffs_p3):
@@ -272,8 +327,9 @@ def main():
     print("  1. Use PDF example values")
     print("  2. Enter custom values (simple format)")
     print("  3. Enter custom values (PDF table format)")
+    print("  4. Load payoffs from file (.npz or .yaml)")
     
-    choice = input("\nYour choice (1, 2, or 3): ").strip()
+    choice = input("\nYour choice (1, 2, 3, or 4): ").strip()
     
     if choice == "1":
         payoffs_p1, payoffs_p2, payoffs_p3 = use_pdf_example()
@@ -281,6 +337,9 @@ def main():
         payoffs_p1, payoffs_p2, payoffs_p3 = input_escalation_game()
     elif choice == "3":
         payoffs_p1, payoffs_p2, payoffs_p3 = input_from_pdf_format()
+    elif choice == "4":
+        path = input("\nEnter the path to your payoff file: ").strip().strip('"').strip("'")
+        payoffs_p1, payoffs_p2, payoffs_p3 = load_payoffs_from_file(path)
     else:
         print("Invalid choice. Using PDF example.")
         payoffs_p1, payoffs_p2, payoffs_p3 = use_pdf_example()
@@ -12,13 +12,29 @@ expected payoffs for each strategy combination.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
-from itertools import product
+from dataclasses import dataclass, fields
+from functools import lru_cache
 import csv
+import numbers
 import numpy as np
 from typing import Dict, List, Tuple, Any, Optional
 
 
+def _clamp01(x: float, name: str) -> float:
+    if not isinstance(x, numbers.Real):
+        raise TypeError(f"{name} must be a number in [0,1], got {type(x)}")
+    x = float(x)
+    if x < 0.0 or x > 1.0:
+        raise ValueError(f"{name} must be in [0,1], got {x}")
+    return x
+
+
+def _validate_fields(obj: Any) -> None:
+    """Validate every field of a frozen probability dataclass in place."""
+    for f in fields(obj):
+        object.__setattr__(obj, f.name, _clamp01(getattr(obj, f.name), f.name))
+
+
 # =============================================================================
 # OPPOSITION PAYOFF MODEL (Player 1)
 # =============================================================================
@@ -46,58 +62,58 @@ class OppositionProbs:
     CL: float   # Civil Liberties
     MI: float   # Material Improvement
 
-
-def opposition_payoff_realization(
-    BI: bool, IS: bool, MD: bool, LoC: bool,
-    PR: bool, CL: bool, MI: bool
-) -> float:
-    """One realized payoff for Opposition given boolean outcomes."""
-    # Stage I: build bank additively
-    bank = 0.0
-    if PR:
-        bank += OPP_W_PR
-    if CL:
-        bank += OPP_W_CL
-    if MI:
-        bank += OPP_W_MI
-
-    # Stage II: degrade bank when things go wrong
-    if not BI:
-        bank *= OPP_MULT_BI_NO
-    if not IS:
-        bank *= OPP_MULT_IS_NO
-    if not MD:
-        bank *= OPP_MULT_MD_NO
-    if not LoC:
-        bank *= OPP_MULT_LOC_NO
-
-    return bank
+    def __post_init__(self) -> None:
+        _validate_fields(self)
 
 
+@lru_cache(maxsize=4096)
 def opposition_expected_payoff(p: OppositionProbs) -> float:
     """
-    Exact expected payoff for Opposition via full enumeration of all 128 states.
-    Assumes independence across events.
+    Exact expected payoff for Opposition in closed form.
+
+    Stage I (PR, CL, MI) and Stage II (BI, IS, MD, LoC) use disjoint,
+    independent events, so the expectation factorizes:
+        E[payoff] = E[Stage I bank] * E[Stage II multiplier]
+    and the 128 joint states never need to be enumerated.
     """
-    probs_yes = {
-        "BI": p.BI, "IS": p.IS, "MD": p.MD, "LoC": p.LoC,
-        "PR": p.PR, "CL": p.CL, "MI": p.MI,
-    }
+    return opposition_expected_payoff_raw(p.BI, p.IS, p.MD, p.LoC, p.PR, p.CL, p.MI)
 
-    expected = 0.0
-    for BI, IS, MD, LoC, PR, CL, MI in product([False, True], repeat=7):
-        state_prob = 1.0
-        state_prob *= probs_yes["BI"] if BI else (1.0 - probs_yes["BI"])
-        state_prob *= probs_yes["IS"] if IS else (1.0 - probs_yes["IS"])
-        state_prob *= probs_yes["MD"] if MD else (1.0 - probs_yes["MD"])
-        state_prob *= probs_yes["LoC"] if LoC else (1.0 - probs_yes["LoC"])
-        state_prob *= probs_yes["PR"] if PR else (1.0 - probs_yes["PR"])
-        state_prob *= probs_yes["CL"] if CL else (1.0 - probs_yes["CL"])
-        state_prob *= probs_yes["MI"] if MI else (1.0 - probs_yes["MI"])
 
-        expected += state_prob * opposition_payoff_realization(BI, IS, MD, LoC, PR, CL, MI)
+def opposition_expected_payoff_raw(BI: float, IS: float, MD: float, LoC: float,
+                                   PR: float, CL: float, MI: float) -> float:
+    """opposition_expected_payoff on plain floats, skipping the dataclass."""
+    stage1 = OPP_W_PR * PR + OPP_W_CL * CL + OPP_W_MI * MI
+    return stage1 * _opp_stage2(BI, IS, MD, LoC)
 
-    return expected
+
+@lru_cache(maxsize=256)
+def _opp_stage2(BI: float, IS: float, MD: float, LoC: float) -> float:
+    """
+    E[Stage II multiplier], memoized: cells that share (BI, IS, MD, LoC)
+    but differ in Stage I only pay for the Stage I sum.
+    """
+    return (
+        (BI + (1.0 - BI) * OPP_MULT_BI_NO)
+        * (IS + (1.0 - IS) * OPP_MULT_IS_NO)
+        * (MD + (1.0 - MD) * OPP_MULT_MD_NO)
+        * (LoC + (1.0 - LoC) * OPP_MULT_LOC_NO)
+    )
+
+
+def opposition_expected_payoff_batch(BI: np.ndarray, IS: np.ndarray, MD: np.ndarray,
+                                     LoC: np.ndarray, PR: np.ndarray, CL: np.ndarray,
+                                     MI: np.ndarray) -> np.ndarray:
+    """
+    Vectorized opposition_expected_payoff over equal-shaped arrays of probabilities.
+    """
+    stage1 = OPP_W_PR * PR + OPP_W_CL * CL + OPP_W_MI * MI
+    stage2 = (
+        (BI + (1.0 - BI) * OPP_MULT_BI_NO)
+        * (IS + (1.0 - IS) * OPP_MULT_IS_NO)
+        * (MD + (1.0 - MD) * OPP_MULT_MD_NO)
+        * (LoC + (1.0 - LoC) * OPP_MULT_LOC_NO)
+    )
+    return stage1 * stage2
 
 
 # =============================================================================
@@ -121,7 +137,11 @@ class RegimeProbs:
     C: float  # Credible internal power
     V: float  # Not getting subjected to violence
 
+    def __post_init__(self) -> None:
+        _validate_fields(self)
 
+
+@lru_cache(maxsize=4096)
 def regime_expected_payoff(p: RegimeProbs) -> float:
     """
     Expected payoff for Regime.
@@ -129,13 +149,26 @@ def regime_expected_payoff(p: RegimeProbs) -> float:
     If Survival (S=True): Base 50 + bonuses from M, R, C
     If No Survival (S=False): Only V contributes (20 points)
     """
-    survive_branch = REG_BASE_SURVIVE + REG_W_M * p.M + REG_W_R * p.R + REG_W_C * p.C
-    no_survive_branch = REG_W_V * p.V
+    return regime_expected_payoff_raw(p.S, p.M, p.R, p.C, p.V)
+
 
-    expected = p.S * survive_branch + (1.0 - p.S) * no_survive_branch
+def regime_expected_payoff_raw(S: float, M: float, R: float, C: float, V: float) -> float:
+    """regime_expected_payoff on plain floats, skipping the dataclass."""
+    expected = (S * (REG_BASE_SURVIVE + REG_W_M * M + REG_W_R * R + REG_W_C * C)
+                + (1.0 - S) * REG_W_V * V)
     return min(100.0, max(0.0, expected))
 
 
+def regime_expected_payoff_batch(S: np.ndarray, M: np.ndarray, R: np.ndarray,
+                                 C: np.ndarray, V: np.ndarray) -> np.ndarray:
+    """
+    Vectorized regime_expected_payoff over 1-D arrays of probabilities.
+    """
+    expected = (S * (REG_BASE_SURVIVE + REG_W_M * M + REG_W_R * R + REG_W_C * C)
+                + (1.0 - S) * REG_W_V * V)
+    return np.clip(expected, 0.0, 100.0)
+
+
 # =============================================================================
 # ISRAEL PAYOFF MODEL (Player 3)
 # =============================================================================
@@ -155,7 +188,6 @@ ISR_W_BANK2 = 0.40
 
 ISR_BANK_MAX = 100.0
 
-
 @dataclass(frozen=True)
 class IsraelProbs:
     """Probabilities for Israel goals (0..1)."""
@@ -165,7 +197,11 @@ class IsraelProbs:
     G4: float  # Goal 4
     G5: float  # Goal 5
 
+    def __post_init__(self) -> None:
+        _validate_fields(self)
+
 
+@lru_cache(maxsize=4096)
 def israel_expected_payoff(p: IsraelProbs) -> float:
     """
     Expected payoff for Israel using two-bank additive system.
@@ -174,8 +210,27 @@ def israel_expected_payoff(p: IsraelProbs) -> float:
     Bank2 = 100 * (0.30*G4 + 0.70*G5)
     Final = 0.60 * Bank1 + 0.40 * Bank2
     """
-    bank1 = ISR_BANK_MAX * (ISR_W_G1 * p.G1 + ISR_W_G2 * p.G2 + ISR_W_G3 * p.G3)
-    bank2 = ISR_BANK_MAX * (ISR_W_G4 * p.G4 + ISR_W_G5 * p.G5)
+    return israel_expected_payoff_raw(p.G1, p.G2, p.G3, p.G4, p.G5)
+
+
+def israel_expected_payoff_raw(G1: float, G2: float, G3: float, G4: float, G5: float) -> float:
+    """israel_expected_payoff on plain floats, skipping the dataclass."""
+    bank1 = ISR_BANK_MAX * (ISR_W_G1 * G1 + ISR_W_G2 * G2 + ISR_W_G3 * G3)
+    bank2 = ISR_BANK_MAX * (ISR_W_G4 * G4 + ISR_W_G5 * G5)
+    return ISR_W_BANK1 * bank1 + ISR_W_BANK2 * bank2
+
+
+def israel_expected_payoff_batch(G1: np.ndarray, G2: np.ndarray, G3: np.ndarray,
+                                 G4: np.ndarray, G5: np.ndarray) -> np.ndarray:
+    """
+    Vectorized israel_expected_payoff over equal-shaped arrays of probabilities.
+    
+    Keeps the per-bank evaluation order: folding the weights into one
+    coefficient per goal rounds differently and flips printed values
+    that sit on a half-cent tie.
+    """
+    bank1 = ISR_BANK_MAX * (ISR_W_G1 * G1 + ISR_W_G2 * G2 + ISR_W_G3 * G3)
+    bank2 = ISR_BANK_MAX * (ISR_W_G4 * G4 + ISR_W_G5 * G5)
     return ISR_W_BANK1 * bank1 + ISR_W_BANK2 * bank2
 
 
@@ -183,6 +238,16 @@ def israel_expected_payoff(p: IsraelProbs) -> float:
 # CSV LOADING AND GAME CONSTRUCTION
 # =============================================================================
 
+# Payoff tensors stay float64: float32 rounding shifts half-cent payoffs in
+# the two-decimal displays and can change best-response ties
+PAYOFF_DTYPE = np.float64
+
+# Column order used when stacking per-cell parameters into arrays
+OPP_KEYS = ('BI', 'IS', 'MD', 'LoC', 'PR', 'CL', 'MI')
+REG_KEYS = ('S', 'M', 'R', 'C', 'V')
+ISR_KEYS = ('G1', 'G2', 'G3', 'G4', 'G5')
+
+
 def load_probabilities_from_csv(filepath: str) -> Dict[Tuple[int, int, int], Dict[str, Dict[str, float]]]:
     """
     Load probability parameters from CSV file.
@@ -229,6 +294,137 @@ def load_probabilities_from_csv(filepath: str) -> Dict[Tuple[int, int, int], Dic
     return probabilities
 
 
+def load_arrays_from_csv(filepath: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Load probability parameters from CSV file as column-stacked arrays.
+    
+    Only the needed columns are picked out of each row and converted in
+    one NumPy call; no nested dicts are built. Extra columns (labels,
+    computed payoffs) are ignored, so files written by
+    create_game_probability_csv load as well. Quoted fields, e.g. labels
+    containing commas, are handled by the csv module.
+    
+    Returns:
+        Tuple of (keys, opp_mat, reg_mat, isr_mat) with shapes
+        (N, 3), (N, 7), (N, 5), (N, 5); columns follow OPP_KEYS,
+        REG_KEYS and ISR_KEYS
+    """
+    names = (('p1_strat', 'p2_strat', 'p3_strat')
+             + tuple(f'opp_{k}' for k in OPP_KEYS)
+             + tuple(f'reg_{k}' for k in REG_KEYS)
+             + tuple(f'isr_{k}' for k in ISR_KEYS))
+    
+    with open(filepath, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"CSV file is empty (no header row): {filepath}")
+        header = [name.strip() for name in header]
+        missing = [n for n in names if n not in header]
+        if missing:
+            raise KeyError(missing[0])
+        cols = [header.index(n) for n in names]
+        rows = [[row[i] for i in cols] for row in reader if row]
+    
+    table = np.array(rows, dtype=np.float64).reshape(len(rows), len(names))
+    keys = table[:, :3].astype(np.int64)
+    # A key like 1.5 would silently truncate onto another cell
+    bad = np.flatnonzero(~np.all(table[:, :3] == keys, axis=1))
+    if len(bad):
+        raise ValueError(f"strategy indices must be integers, got "
+                         f"{table[bad[0], :3].tolist()} (row {bad[0]})")
+    opp_mat, reg_mat, isr_mat = np.hsplit(
+        table[:, 3:], np.cumsum([len(OPP_KEYS), len(REG_KEYS)]))
+    return keys, opp_mat, reg_mat, isr_mat
+
+
+def _check_unit_interval(mat: np.ndarray, prefix: str, names: Tuple[str, ...]) -> None:
+    """Raise ValueError naming the first entry of mat outside [0,1] (or NaN)."""
+    bad = np.argwhere(~((mat >= 0.0) & (mat <= 1.0)))
+    if len(bad):
+        row, col = bad[0]
+        raise ValueError(
+            f"{prefix}{names[col]} must be in [0,1], got {mat[row, col]} (row {row})"
+        )
+
+
+def compute_payoff_vectors(
+    opp_mat: np.ndarray, reg_mat: np.ndarray, isr_mat: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute each player's expected payoff for every row of probabilities.
+    
+    Args:
+        opp_mat, reg_mat, isr_mat: (N, 7), (N, 5), (N, 5) probabilities,
+            columns ordered as OPP_KEYS, REG_KEYS, ISR_KEYS
+    
+    Returns:
+        Tuple of three float64 (N,) arrays (opposition, regime, israel)
+    """
+    # One vectorized range check per table instead of per-value _clamp01
+    _check_unit_interval(opp_mat, 'opp_', OPP_KEYS)
+    _check_unit_interval(reg_mat, 'reg_', REG_KEYS)
+    _check_unit_interval(isr_mat, 'isr_', ISR_KEYS)
+    
+    # Opposition: E[Stage I bank] * E[Stage II multiplier]
+    p1_vals = opposition_expected_payoff_batch(*opp_mat.T)
+    
+    # Regime: survive / no-survive branches
+    p2_vals = regime_expected_payoff_batch(*reg_mat.T)
+    
+    # Israel: two additive banks
+    p3_vals = israel_expected_payoff_batch(*isr_mat.T)
+    
+    return p1_vals, p2_vals, p3_vals
+
+
+def compute_payoff_tensor(
+    keys: np.ndarray, opp_mat: np.ndarray, reg_mat: np.ndarray, isr_mat: np.ndarray
+) -> np.ndarray:
+    """
+    Compute all three players' payoffs into one contiguous tensor.
+    
+    Args:
+        keys: (N, 3) integer strategy profiles (p1_strat, p2_strat, p3_strat)
+        opp_mat, reg_mat, isr_mat: (N, 7), (N, 5), (N, 5) probabilities,
+            columns ordered as OPP_KEYS, REG_KEYS, ISR_KEYS
+    
+    Returns:
+        PAYOFF_DTYPE array of shape (3, 2, 4, 2); payoffs[i] is player i's
+        (2, 4, 2) cube
+    """
+    payoffs = np.zeros((3, 2, 4, 2), dtype=PAYOFF_DTYPE)
+    
+    if len(keys) == 0:
+        return payoffs
+    
+    payoffs[:, keys[:, 0], keys[:, 1], keys[:, 2]] = np.stack(
+        compute_payoff_vectors(opp_mat, reg_mat, isr_mat)
+    )
+    
+    return payoffs
+
+
+def compute_payoffs_from_arrays(
+    keys: np.ndarray, opp_mat: np.ndarray, reg_mat: np.ndarray, isr_mat: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute payoff matrices from column-stacked probability arrays.
+    
+    Args:
+        keys: (N, 3) integer strategy profiles (p1_strat, p2_strat, p3_strat)
+        opp_mat, reg_mat, isr_mat: (N, 7), (N, 5), (N, 5) probabilities,
+            columns ordered as OPP_KEYS, REG_KEYS, ISR_KEYS
+    
+    Returns:
+        Tuple of (opposition_payoffs, regime_payoffs, israel_payoffs)
+        Each array has shape (2, 4, 2) for the 2x4x2 game; all
+        three are views into a single compute_payoff_tensor result
+    """
+    payoffs = compute_payoff_tensor(keys, opp_mat, reg_mat, isr_mat)
+    return payoffs[0], payoffs[1], payoffs[2]
+
+
 def compute_payoffs_from_probabilities(
     probabilities: Dict[Tuple[int, int, int], Dict[str, Dict[str, float]]]
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -239,39 +435,37 @@ def compute_payoffs_from_probabilities(
         Tuple of (opposition_payoffs, regime_payoffs, israel_payoffs)
         Each array has shape (2, 4, 2) for the 2x4x2 game
     """
-    # Initialize payoff matrices
-    payoffs_p1 = np.zeros((2, 4, 2))  # Opposition
-    payoffs_p2 = np.zeros((2, 4, 2))  # Regime
-    payoffs_p3 = np.zeros((2, 4, 2))  # Israel
-    
-    for (p1, p2, p3), probs in probabilities.items():
-        # Opposition payoff
-        opp_probs = OppositionProbs(**probs['opposition'])
-        payoffs_p1[p1, p2, p3] = opposition_expected_payoff(opp_probs)
-        
-        # Regime payoff
-        reg_probs = RegimeProbs(**probs['regime'])
-        payoffs_p2[p1, p2, p3] = regime_expected_payoff(reg_probs)
-        
-        # Israel payoff
-        isr_probs = IsraelProbs(**probs['israel'])
-        payoffs_p3[p1, p2, p3] = israel_expected_payoff(isr_probs)
+    # Stack every cell's parameters into (N, k) arrays, one row per cell
+    keys = np.array(list(probabilities.keys()), dtype=np.int64).reshape(-1, 3)
+    opp_mat = np.array([[d['opposition'][k] for k in OPP_KEYS] for d in probabilities.values()])
+    reg_mat = np.array([[d['regime'][k] for k in REG_KEYS] for d in probabilities.values()])
+    isr_mat = np.array([[d['israel'][k] for k in ISR_KEYS] for d in probabilities.values()])
     
-    return payoffs_p1, payoffs_p2, payoffs_p3
+    return compute_payoffs_from_arrays(keys, opp_mat, reg_mat, isr_mat)
 
 
 def normalize_payoffs(payoffs_p1: np.ndarray, payoffs_p2: np.ndarray, 
-                      payoffs_p3: np.ndarray, scale: float = 10.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+                      payoffs_p3: np.ndarray, scale: float = 10.0,
+                      inplace: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Normalize payoffs to a common scale (e.g., 0-10) for easier comparison.
     
     Args:
         payoffs_p1, payoffs_p2, payoffs_p3: Raw payoff matrices (0-100 scale)
         scale: Target maximum value
+        inplace: If True, rescale the given (float) arrays in place and return
+            them, skipping new allocations; only safe when nothing else
+            reads the raw values
     
     Returns:
         Normalized payoff matrices
     """
+    if inplace:
+        for p in (payoffs_p1, payoffs_p2, payoffs_p3):
+            p *= scale
+            p /= 100.0
+        return payoffs_p1, payoffs_p2, payoffs_p3
+    
     return (
         payoffs_p1 * scale / 100.0,
         payoffs_p2 * scale / 100.0,
@@ -297,56 +491,82 @@ def display_payoff_matrices(payoffs_p1: np.ndarray, payoffs_p2: np.ndarray,
     
     p1_name, p2_name, p3_name = player_names
     
-    print("\n" + "=" * 80)
-    print("PAYOFF MATRICES")
-    print("=" * 80)
+    lines = ["\n" + "=" * 80, "PAYOFF MATRICES", "=" * 80]
+    
+    # One (3, 2, 4, 2) tensor keeps each cell's three payoffs together
+    payoffs = np.stack([payoffs_p1, payoffs_p2, payoffs_p3])
+    
+    # Header is identical for every table
+    rule = "-" * 80
+    header = f"{'Regime Strat':<15} {'Opposition':<15} {'Regime':<15} {'Israel':<15}"
     
     # For each combination of P1 and P3 strategies
     for p1_strat in range(2):
         for p3_strat in range(2):
-            print(f"\n{p1_name} Strategy {p1_strat}, {p3_name} Strategy {p3_strat}")
-            print("-" * 80)
-            
-            # Header
-            print(f"{'Regime Strat':<15} {'Opposition':<15} {'Regime':<15} {'Israel':<15}")
-            print("-" * 80)
+            lines.append(f"\n{p1_name} Strategy {p1_strat}, {p3_name} Strategy {p3_strat}")
+            lines += [rule, header, rule]
             
             # Display each regime strategy
             for p2_strat in range(4):
-                opp_payoff = payoffs_p1[p1_strat, p2_strat, p3_strat]
-                reg_payoff = payoffs_p2[p1_strat, p2_strat, p3_strat]
-                isr_payoff = payoffs_p3[p1_strat, p2_strat, p3_strat]
-                
-                print(f"{p2_strat:<15} {opp_payoff:<15.2f} {reg_payoff:<15.2f} {isr_payoff:<15.2f}")
+                opp_payoff, reg_payoff, isr_payoff = payoffs[:, p1_strat, p2_strat, p3_strat]
+                lines.append(f"{p2_strat:<15} {opp_payoff:<15.2f} {reg_payoff:<15.2f} {isr_payoff:<15.2f}")
+    
+    print("\n".join(lines))
 
 
 def display_payoff_summary(payoffs_p1: np.ndarray, payoffs_p2: np.ndarray, 
                           payoffs_p3: np.ndarray):
     """Display summary statistics for each player's payoffs."""
-    print("\n" + "=" * 80)
-    print("PAYOFF SUMMARY STATISTICS")
-    print("=" * 80)
+    lines = ["\n" + "=" * 80, "PAYOFF SUMMARY STATISTICS", "=" * 80]
+    
+    # Reduce all three players at once over the strategy axes
+    payoffs = np.stack([payoffs_p1, payoffs_p2, payoffs_p3])
+    axes = tuple(range(1, payoffs.ndim))
+    mins = np.min(payoffs, axis=axes)
+    maxs = np.max(payoffs, axis=axes)
+    means = np.mean(payoffs, axis=axes, dtype=np.float64)
+    medians = np.median(payoffs.reshape(len(payoffs), -1), axis=1)
     
-    players = [
-        ("Opposition", payoffs_p1),
-        ("Regime", payoffs_p2),
-        ("Israel", payoffs_p3)
-    ]
+    for i, name in enumerate(("Opposition", "Regime", "Israel")):
+        lines += [
+            f"\n{name}:",
+            f"  Min:    {mins[i]:.2f}",
+            f"  Max:    {maxs[i]:.2f}",
+            f"  Mean:   {means[i]:.2f}",
+            f"  Median: {medians[i]:.2f}",
+        ]
     
-    for name, payoffs in players:
-        print(f"\n{name}:")
-        print(f"  Min:    {np.min(payoffs):.2f}")
-        print(f"  Max:    {np.max(payoffs):.2f}")
-        print(f"  Mean:   {np.mean(payoffs):.2f}")
-        print(f"  Median: {np.median(payoffs):.2f}")
+    print("\n".join(lines))
 
 
 # =============================================================================
 # MAIN EXECUTION
 # =============================================================================
 
+def load_and_compute(csv_path: str, normalize: bool = False):
+    """
+    Load a probability CSV and compute all three payoff matrices, without I/O.
+
+    Args:
+        csv_path: Path to CSV with probability parameters
+        normalize: If True, rescale payoffs to the 0-10 scale
+
+    Returns:
+        Tuple of (payoffs_p1, payoffs_p2, payoffs_p3) arrays of shape (2, 4, 2)
+    """
+    keys, opp_mat, reg_mat, isr_mat = load_arrays_from_csv(csv_path)
+    payoffs_p1, payoffs_p2, payoffs_p3 = compute_payoffs_from_arrays(
+        keys, opp_mat, reg_mat, isr_mat
+    )
+    if normalize:
+        payoffs_p1, payoffs_p2, payoffs_p3 = normalize_payoffs(
+            payoffs_p1, payoffs_p2, payoffs_p3, inplace=True
+        )
+    return payoffs_p1, payoffs_p2, payoffs_p3
+
+
 def main():
-    """Main function to load CSV and compute payoffs."""
+    """Interactive wrapper: prompt for a CSV, compute payoffs and display them."""
     print("Three-Player Game Payoff Calculator")
     print("=" * 50)
     
@@ -357,19 +577,21 @@ def main():
     csv_path = csv_path.strip('"').strip("'")
     
     try:
-        # Load probabilities from CSV
         print(f"\nLoading probabilities from: {csv_path}")
-        probabilities = load_probabilities_from_csv(csv_path)
-        print(f"Successfully loaded {len(probabilities)} strategy combinations")
+        keys, opp_mat, reg_mat, isr_mat = load_arrays_from_csv(csv_path)
+        print(f"Successfully loaded {len(np.unique(keys, axis=0))} strategy combinations")
         
-        # Compute payoffs
         print("\nComputing expected payoffs...")
-        payoffs_p1, payoffs_p2, payoffs_p3 = compute_payoffs_from_probabilities(probabilities)
+        payoffs_p1, payoffs_p2, payoffs_p3 = compute_payoffs_from_arrays(
+            keys, opp_mat, reg_mat, isr_mat
+        )
         
         # Optional: normalize payoffs
         normalize = input("\nNormalize payoffs to 0-10 scale? (y/n): ").strip().lower()
         if normalize == 'y':
-            payoffs_p1, payoffs_p2, payoffs_p3 = normalize_payoffs(payoffs_p1, payoffs_p2, payoffs_p3)
+            payoffs_p1, payoffs_p2, payoffs_p3 = normalize_payoffs(
+                payoffs_p1, payoffs_p2, payoffs_p3, inplace=True
+            )
             print("Payoffs normalized to 0-10 scale")
         
         print("\nPayoff computation complete!")
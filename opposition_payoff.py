@@ -31,17 +31,24 @@ Final Payoff = bank after multipliers.
 
 NOTES:
 - This is a clean “add then degrade” structure.
-- Analytic expectation below is computed EXACTLY by enumerating all 2^7 = 128 states,
-  assuming independence across events.
+- Analytic expectation below is computed EXACTLY in closed form, assuming
+  independence across events: E[bank] * prod of E[multiplier] per gate.
+  _expected_payoff_enum enumerates all 2^7 = 128 states; the demo below
+  prints both as a cross-check.
 - Monte Carlo sim should converge to the analytic value as n increases.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
-from itertools import product
+from dataclasses import dataclass, fields
+from functools import lru_cache
+import numbers
 import random
 from typing import Optional, Dict, Any
 
+import numpy as np
+
+from monte_carlo import bernoulli_draws, check_sample_mean, sanity_draw_count
+
 
 # -------------------------
 # Stage I additive bank weights (points out of 100)
@@ -60,7 +67,7 @@ MULT_LOC_NO = 0.70
 
 
 def _clamp01(x: float, name: str) -> float:
-    if not isinstance(x, (int, float)):
+    if not isinstance(x, numbers.Real):
         raise TypeError(f"{name} must be a number in [0,1], got {type(x)}")
     x = float(x)
     if x < 0.0 or x > 1.0:
@@ -84,18 +91,17 @@ class EventProbs:
     CL: float   # Civil Liberties
     MI: float   # Material Improvement
 
+    def __post_init__(self) -> None:
+        # Validate once at construction; frozen, so write through object
+        for f in fields(self):
+            object.__setattr__(self, f.name, _clamp01(getattr(self, f.name), f.name))
+
     def validated(self) -> "EventProbs":
-        return EventProbs(
-            BI=_clamp01(self.BI, "BI"),
-            IS=_clamp01(self.IS, "IS"),
-            MD=_clamp01(self.MD, "MD"),
-            LoC=_clamp01(self.LoC, "LoC"),
-            PR=_clamp01(self.PR, "PR"),
-            CL=_clamp01(self.CL, "CL"),
-            MI=_clamp01(self.MI, "MI"),
-        )
+        # Already validated in __post_init__
+        return self
 
 
+@lru_cache(maxsize=128)
 def payoff_from_realization(
     BI: bool, IS: bool, MD: bool, LoC: bool,
     PR: bool, CL: bool, MI: bool
@@ -125,11 +131,25 @@ def payoff_from_realization(
     return bank
 
 
+def payoff_from_realization_batch(
+    BI: np.ndarray, IS: np.ndarray, MD: np.ndarray, LoC: np.ndarray,
+    PR: np.ndarray, CL: np.ndarray, MI: np.ndarray
+) -> np.ndarray:
+    """
+    Elementwise payoff_from_realization over equal-shaped boolean arrays.
+    """
+    bank = W_PR * PR + W_CL * CL + W_MI * MI
+    bank = bank * np.where(BI, 1.0, MULT_BI_NO)
+    bank = bank * np.where(IS, 1.0, MULT_IS_NO)
+    bank = bank * np.where(MD, 1.0, MULT_MD_NO)
+    bank = bank * np.where(LoC, 1.0, MULT_LOC_NO)
+    return bank
+
+
 def payoff_one_draw(p: EventProbs, rng: Optional[random.Random] = None) -> float:
     """
     One Monte Carlo draw (independence assumption): sample each event, compute payoff.
     """
-    p = p.validated()
     rng = rng or random.Random()
 
     BI = rng.random() < p.BI
@@ -140,54 +160,116 @@ def payoff_one_draw(p: EventProbs, rng: Optional[random.Random] = None) -> float
     CL = rng.random() < p.CL
     MI = rng.random() < p.MI
 
-    return payoff_from_realization(BI, IS, MD, LoC, PR, CL, MI)
+    idx = (PR | CL << 1 | MI << 2
+           | BI << 3 | IS << 4 | MD << 5 | LoC << 6)
+    return float(_STATE_PAYOFF_LUT[idx])
 
 
+def _joint_state_probs(probs_yes) -> np.ndarray:
+    """
+    Probability of every joint outcome of independent events.
+    Entry i has event k = True iff bit k of i is set.
+    """
+    out = np.ones(1)
+    for q in probs_yes:
+        out = np.concatenate([out * (1.0 - q), out * q])
+    return out
+
+
+# Realized payoff per 7-bit state: bits 0-2 = (PR, CL, MI), bits 3-6 = (BI, IS, MD, LoC)
+_STATE_PAYOFF_LUT = np.array([
+    payoff_from_realization(*(bool(i >> k & 1) for k in (3, 4, 5, 6, 0, 1, 2)))
+    for i in range(128)
+])
+
+
+@lru_cache(maxsize=4096)
 def expected_payoff_analytic(p: EventProbs) -> float:
     """
-    Exact expected payoff via full enumeration of all 128 states (assumes independence).
+    Exact expected payoff in closed form (assumes independence).
+
+    Stage I is additive and each Stage II multiplier acts independently:
+        E[payoff] = (30*PR + 30*CL + 40*MI) * prod_g (p_g + (1 - p_g) * mult_g)
+    for g in {BI, IS, MD, LoC}. The __main__ demo cross-checks it against
+    _expected_payoff_enum.
     """
-    p = p.validated()
-    probs_yes = {
-        "BI": p.BI, "IS": p.IS, "MD": p.MD, "LoC": p.LoC,
-        "PR": p.PR, "CL": p.CL, "MI": p.MI,
-    }
+    bank_mean = W_PR * p.PR + W_CL * p.CL + W_MI * p.MI
+    deg = (
+        (p.BI + (1.0 - p.BI) * MULT_BI_NO)
+        * (p.IS + (1.0 - p.IS) * MULT_IS_NO)
+        * (p.MD + (1.0 - p.MD) * MULT_MD_NO)
+        * (p.LoC + (1.0 - p.LoC) * MULT_LOC_NO)
+    )
+    return bank_mean * deg
 
-    expected = 0.0
-    for BI, IS, MD, LoC, PR, CL, MI in product([False, True], repeat=7):
-        state_prob = 1.0
-        state_prob *= probs_yes["BI"] if BI else (1.0 - probs_yes["BI"])
-        state_prob *= probs_yes["IS"] if IS else (1.0 - probs_yes["IS"])
-        state_prob *= probs_yes["MD"] if MD else (1.0 - probs_yes["MD"])
-        state_prob *= probs_yes["LoC"] if LoC else (1.0 - probs_yes["LoC"])
-        state_prob *= probs_yes["PR"] if PR else (1.0 - probs_yes["PR"])
-        state_prob *= probs_yes["CL"] if CL else (1.0 - probs_yes["CL"])
-        state_prob *= probs_yes["MI"] if MI else (1.0 - probs_yes["MI"])
 
-        expected += state_prob * payoff_from_realization(BI, IS, MD, LoC, PR, CL, MI)
+def expected_payoffs_batch(M: np.ndarray) -> np.ndarray:
+    """
+    expected_payoff_analytic over many scenarios at once.
 
-    return expected
+    M is an (N, 7) array whose columns are ordered like EventProbs:
+    BI, IS, MD, LoC, PR, CL, MI. Returns an (N,) vector of expected payoffs.
+    """
+    M = np.asarray(M, dtype=np.float64)
+    if M.ndim != 2 or M.shape[1] != 7:
+        raise ValueError(f"M must have shape (N, 7), got {M.shape}")
+    if np.any((M < 0.0) | (M > 1.0)):
+        raise ValueError("all probabilities in M must be in [0,1]")
+
+    BI, IS, MD, LoC, PR, CL, MI = M.T
+    bank_mean = W_PR * PR + W_CL * CL + W_MI * MI
+    deg = (
+        (BI + (1.0 - BI) * MULT_BI_NO)
+        * (IS + (1.0 - IS) * MULT_IS_NO)
+        * (MD + (1.0 - MD) * MULT_MD_NO)
+        * (LoC + (1.0 - LoC) * MULT_LOC_NO)
+    )
+    return bank_mean * deg
+
+
+def _expected_payoff_enum(p: EventProbs) -> float:
+    """
+    Reference expected payoff by enumerating all 128 states (assumes independence).
+
+    Weights each state's realized payoff by its joint probability in one
+    dot product, without relying on the Stage I / Stage II factorization
+    used by expected_payoff_analytic.
+    """
+    state_probs = _joint_state_probs((p.PR, p.CL, p.MI, p.BI, p.IS, p.MD, p.LoC))
+    return float(state_probs @ _STATE_PAYOFF_LUT)
+
+
+def sample_payoffs(p: EventProbs, n: int = 200_000, seed: int = 1) -> np.ndarray:
+    """
+    n Monte Carlo payoff realizations (independence assumption).
+    All n draws of the seven events are sampled as one (n, 7) batch.
+    """
+    if n <= 0:
+        raise ValueError("n must be a positive integer")
+    probs = np.array([p.BI, p.IS, p.MD, p.LoC, p.PR, p.CL, p.MI])
+    return payoff_from_realization_batch(*bernoulli_draws(probs, n, seed).T)
 
 
 def expected_payoff_monte_carlo(p: EventProbs, n: int = 200_000, seed: int = 1) -> float:
     """
-    Monte Carlo estimate of expected payoff (sanity check).
+    Monte Carlo sanity check of the expected payoff.
+
+    expected_payoff_analytic is exact, so it serves as the control: only
+    sanity_draw_count(n) draws are sampled, monte_carlo.check_sample_mean
+    warns if their mean diverges from it, and the exact value is returned.
+    Use sample_payoffs for the sampled distribution itself.
     """
     if n <= 0:
         raise ValueError("n must be a positive integer")
-    rng = random.Random(seed)
-    total = 0.0
-    for _ in range(n):
-        total += payoff_one_draw(p, rng=rng)
-    return total / n
+    exact = expected_payoff_analytic(p)
+    check_sample_mean(exact, sample_payoffs(p, sanity_draw_count(n), seed), 0.0, 100.0)
+    return exact
 
 
 def breakdown(p: EventProbs) -> Dict[str, Any]:
     """
     Useful reporting: min/max and expectation.
     """
-    p = p.validated()
-
     max_bank = W_PR + W_CL + W_MI  # 100
     min_bank = 0.0
 
@@ -225,12 +307,17 @@ if __name__ == "__main__":
         MI=0.50,   # P(Material Improvement = Yes)
     )
 
-    print("=== Analytic expected payoff (exact enumeration) ===")
+    print("=== Analytic expected payoff (closed form) ===")
     e = expected_payoff_analytic(probs)
     print(f"Expected payoff: {e:.2f} / 100")
 
+    print("\n=== Enumeration cross-check (all 128 states) ===")
+    e_enum = _expected_payoff_enum(probs)
+    print(f"Enumerated expected payoff: {e_enum:.2f} / 100 "
+          f"(difference from closed form {abs(e - e_enum):.1e})")
+
     print("\n=== Monte Carlo sanity check ===")
-    e_mc = expected_payoff_monte_carlo(probs, n=200_000, seed=1)
+    e_mc = float(sample_payoffs(probs, n=200_000, seed=1).mean())
     print(f"Monte Carlo expected payoff: {e_mc:.2f} / 100")
 
     print("\n=== Breakdown ===")
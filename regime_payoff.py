@@ -25,16 +25,25 @@ PAYOFF LOGIC (diagram + your clarification):
    - M, R, C are ignored in this branch.
 
 This code provides:
-- expected_payoff_analytic: expected payoff given probabilities (main use)
-- payoff_one_draw: one simulated payoff draw (for intuition / Monte Carlo)
-- expected_payoff_monte_carlo: Monte Carlo estimate to sanity check analytic result
+- expected_payoff_analytic: expected payoff given probabilities (main use);
+  exact under independence, no sampling involved
+- payoff_one_draw: one simulated payoff draw (for intuition only)
+- sample_payoffs: batched Monte Carlo payoff realizations
+- expected_payoff_monte_carlo: cheap sanity check of the analytic result,
+  using it as a control
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache
+import numbers
 import random
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
+
+from monte_carlo import bernoulli_draws, check_sample_mean, sanity_draw_count
 
 
 # ---- Weights (points out of 100) ----
@@ -46,7 +55,7 @@ W_V = 20.0
 
 
 def _clamp01(x: float, name: str) -> float:
-    if not isinstance(x, (int, float)):
+    if not isinstance(x, numbers.Real):
         raise TypeError(f"{name} must be a number in [0,1], got {type(x)}")
     if x < 0.0 or x > 1.0:
         raise ValueError(f"{name} must be in [0,1], got {x}")
@@ -64,16 +73,17 @@ class EventProbs:
     C: float  # Credible internal power
     V: float  # Not getting subjected to violence
 
+    def __post_init__(self) -> None:
+        # Validate once at construction; frozen, so write through object
+        for f in fields(self):
+            object.__setattr__(self, f.name, _clamp01(getattr(self, f.name), f.name))
+
     def validated(self) -> "EventProbs":
-        return EventProbs(
-            S=_clamp01(self.S, "S"),
-            M=_clamp01(self.M, "M"),
-            R=_clamp01(self.R, "R"),
-            C=_clamp01(self.C, "C"),
-            V=_clamp01(self.V, "V"),
-        )
+        # Already validated in __post_init__
+        return self
 
 
+@lru_cache(maxsize=4096)
 def expected_payoff_analytic(p: EventProbs, cap_100: bool = True) -> float:
     """
     Expected payoff out of 100, computed analytically.
@@ -82,6 +92,7 @@ def expected_payoff_analytic(p: EventProbs, cap_100: bool = True) -> float:
                 + (1-P(S)) * (20*P(V))
 
     NOTE:
+    - This is exact, not an estimate; Monte Carlo is only a sanity check.
     - This assumes independence / unconditional probabilities as provided.
     - If you later want conditional probabilities (e.g., M/R/C depend on survival),
       you can extend the formula accordingly.
@@ -90,8 +101,6 @@ def expected_payoff_analytic(p: EventProbs, cap_100: bool = True) -> float:
       If True, caps the expected payoff at 100 (usually unnecessary here because
       max in survive branch is 50+20+20+10=100).
     """
-    p = p.validated()
-
     survive_branch = BASE_SURVIVE + W_M * p.M + W_R * p.R + W_C * p.C
     no_survive_branch = W_V * p.V
 
@@ -102,6 +111,45 @@ def expected_payoff_analytic(p: EventProbs, cap_100: bool = True) -> float:
     return expected
 
 
+def expected_payoffs_batch(P: np.ndarray, cap_100: bool = True) -> np.ndarray:
+    """
+    expected_payoff_analytic over many scenarios at once.
+
+    P is an (N, 5) array whose columns are ordered like EventProbs:
+    S, M, R, C, V. Returns an (N,) vector of expected payoffs.
+    """
+    P = np.asarray(P, dtype=np.float64)
+    if P.ndim != 2 or P.shape[1] != 5:
+        raise ValueError(f"P must have shape (N, 5), got {P.shape}")
+    if np.any((P < 0.0) | (P > 1.0)):
+        raise ValueError("all probabilities in P must be in [0,1]")
+
+    S, M, R, C, V = P.T
+    survive_branch = BASE_SURVIVE + W_M * M + W_R * R + W_C * C
+    expected = S * survive_branch + (1.0 - S) * (W_V * V)
+
+    if cap_100:
+        expected = np.clip(expected, 0.0, 100.0)
+    return expected
+
+
+@lru_cache(maxsize=4096)
+def _probs_vector(p: EventProbs) -> Tuple[float, float, float, float, float]:
+    """Event probabilities as an (S, M, R, C, V) tuple, cached per EventProbs."""
+    return (p.S, p.M, p.R, p.C, p.V)
+
+
+def payoff_from_realization_batch(
+    S: np.ndarray, M: np.ndarray, R: np.ndarray, C: np.ndarray, V: np.ndarray
+) -> np.ndarray:
+    """
+    Realized payoffs (0..100) over equal-shaped boolean arrays of events,
+    computed elementwise; same branches as payoff_one_draw.
+    """
+    survive = BASE_SURVIVE + W_M * M + W_R * R + W_C * C
+    return np.where(S, survive, W_V * V)
+
+
 def payoff_one_draw(p: EventProbs, rng: Optional[random.Random] = None) -> float:
     """
     Generate ONE payoff realization (0..100) by sampling events as Bernoulli trials.
@@ -110,7 +158,6 @@ def payoff_one_draw(p: EventProbs, rng: Optional[random.Random] = None) -> float
     IMPORTANT:
     This samples each event independently using its probability.
     """
-    p = p.validated()
     rng = rng or random.Random()
 
     S = rng.random() < p.S
@@ -134,23 +181,41 @@ def payoff_one_draw(p: EventProbs, rng: Optional[random.Random] = None) -> float
     return payoff
 
 
+def sample_payoffs(
+    p: EventProbs,
+    n: int = 200_000,
+    seed: int = 42,
+) -> np.ndarray:
+    """
+    n Monte Carlo payoff realizations out of 100; all n draws of the
+    five events are sampled as one (n, 5) batch.
+    """
+    if n <= 0:
+        raise ValueError("n must be a positive integer")
+
+    probs = np.array(_probs_vector(p))
+    return payoff_from_realization_batch(*bernoulli_draws(probs, n, seed).T)
+
+
 def expected_payoff_monte_carlo(
     p: EventProbs,
     n: int = 200_000,
     seed: int = 42,
 ) -> float:
     """
-    Monte Carlo estimate of expected payoff out of 100.
-    Sanity-check for the analytic expectation.
+    Monte Carlo sanity check of the expected payoff out of 100.
+
+    The analytic expectation is exact, so it acts as the control: only
+    sanity_draw_count(n) draws are sampled and checked against it by
+    monte_carlo.check_sample_mean, and the exact value is returned. Use
+    sample_payoffs for the sampled distribution itself.
     """
     if n <= 0:
         raise ValueError("n must be a positive integer")
 
-    rng = random.Random(seed)
-    total = 0.0
-    for _ in range(n):
-        total += payoff_one_draw(p, rng=rng)
-    return total / n
+    exact = expected_payoff_analytic(p)
+    check_sample_mean(exact, sample_payoffs(p, sanity_draw_count(n), seed), 0.0, 100.0)
+    return exact
 
 
 def breakdown(p: EventProbs) -> Dict[str, Any]:
@@ -158,8 +223,6 @@ def breakdown(p: EventProbs) -> Dict[str, Any]:
     Helpful breakdown of components for debugging / reporting.
     Returns a dict you can print or log.
     """
-    p = p.validated()
-
     survive_branch = BASE_SURVIVE + W_M * p.M + W_R * p.R + W_C * p.C
     no_survive_branch = W_V * p.V
     expected = expected_payoff_analytic(p)
@@ -191,7 +254,7 @@ if __name__ == "__main__":
     print(f"Expected payoff: {e:.2f} / 100")
 
     print("\n=== Monte Carlo sanity check ===")
-    e_mc = expected_payoff_monte_carlo(probs, n=200_000, seed=1)
+    e_mc = float(sample_payoffs(probs, n=200_000, seed=1).mean())
     print(f"Monte Carlo expected payoff: {e_mc:.2f} / 100")
 
     print("\n=== Breakdown ===")
@@ -13,16 +13,17 @@ Players:
 - Player 3: Israel (2 strategies: Escalate, Deescalate)
 """
 
+import os
 import sys
 import csv
+from functools import lru_cache
 import numpy as np
 from typing import Dict, Tuple, List
 
 from three_player_nash import ThreePlayerGame
 from integrated_payoffs import (
-    OppositionProbs, RegimeProbs, IsraelProbs,
-    opposition_expected_payoff, regime_expected_payoff, israel_expected_payoff,
-    load_probabilities_from_csv, compute_payoffs_from_probabilities,
+    OPP_KEYS, REG_KEYS, ISR_KEYS, compute_payoff_vectors,
+    load_arrays_from_csv, compute_payoff_tensor,
     normalize_payoffs
 )
 
@@ -38,97 +39,106 @@ P2_LABELS = [
 P2_SHORT_LABELS = ["E-Isr & E-Opp", "E-Isr & D-Opp", "D-Isr & E-Opp", "D-Isr & D-Opp"]
 P3_LABELS = ["Escalate", "Deescalate"]
 
+# Static "vs ..." prefixes for analyze_best_responses, indexed by the other
+# two players' strategies
+_OPP_BR_PREFIX = [[f"  vs Regime={P2_SHORT_LABELS[p2]}, Israel={P3_LABELS[p3]}: "
+                  for p3 in range(2)] for p2 in range(4)]
+_REG_BR_PREFIX = [[f"  vs Opposition={P1_LABELS[p1]}, Israel={P3_LABELS[p3]}: "
+                  for p3 in range(2)] for p1 in range(2)]
+_ISR_BR_PREFIX = [[f"  vs Opposition={P1_LABELS[p1]}, Regime={P2_SHORT_LABELS[p2]}: "
+                  for p2 in range(4)] for p1 in range(2)]
+
 
 def display_payoff_tables(payoffs_p1: np.ndarray, payoffs_p2: np.ndarray, 
                           payoffs_p3: np.ndarray, title: str = "GAME PAYOFF TABLES"):
     """Display game payoff tables in a readable format."""
-    print("\n" + "=" * 90)
-    print(title)
-    print("=" * 90)
+    lines = ["\n" + "=" * 90, title, "=" * 90]
+    
+    # Header is the same for every Israel strategy
+    header = f"\n{'Opposition':<15}" + "".join(f"{label:<20}" for label in P2_SHORT_LABELS)
+    
+    # Reorder each cube to [p3][p1][p2] once and convert to nested lists,
+    # so the loops below walk plain rows instead of indexing ndarrays per cell
+    t1, t2, t3 = (p.transpose(2, 0, 1).tolist() for p in (payoffs_p1, payoffs_p2, payoffs_p3))
     
     for p3_idx in range(2):
-        print(f"\n{'=' * 90}")
-        print(f"ISRAEL: {P3_LABELS[p3_idx].upper()}")
-        print("=" * 90)
-        
-        # Header
-        print(f"\n{'Opposition':<15}", end="")
-        for p2_idx in range(4):
-            print(f"{P2_SHORT_LABELS[p2_idx]:<20}", end="")
-        print()
-        print("-" * 90)
+        lines += [f"\n{'=' * 90}", f"ISRAEL: {P3_LABELS[p3_idx].upper()}", "=" * 90]
+        lines += [header, "-" * 90]
         
         # Rows
         for p1_idx in range(2):
-            print(f"{P1_LABELS[p1_idx]:<15}", end="")
-            for p2_idx in range(4):
-                p1_pay = payoffs_p1[p1_idx, p2_idx, p3_idx]
-                p2_pay = payoffs_p2[p1_idx, p2_idx, p3_idx]
-                p3_pay = payoffs_p3[p1_idx, p2_idx, p3_idx]
-                print(f"({p1_pay:>5.2f},{p2_pay:>5.2f},{p3_pay:>5.2f})", end="  ")
-            print()
+            cells = "".join(
+                f"({a:>5.2f},{b:>5.2f},{c:>5.2f})  "
+                for a, b, c in zip(t1[p3_idx][p1_idx], t2[p3_idx][p1_idx], t3[p3_idx][p1_idx])
+            )
+            lines.append(f"{P1_LABELS[p1_idx]:<15}" + cells)
+    
+    print("\n".join(lines))
 
 
 def display_equilibria(equilibria: List[Tuple[int, int, int]], 
                        payoffs_p1: np.ndarray, payoffs_p2: np.ndarray, 
                        payoffs_p3: np.ndarray):
     """Display Nash equilibria with detailed information."""
-    print("\n" + "=" * 90)
-    print("PURE STRATEGY NASH EQUILIBRIA")
-    print("=" * 90)
+    lines = ["\n" + "=" * 90, "PURE STRATEGY NASH EQUILIBRIA", "=" * 90]
     
     if not equilibria:
-        print("\nNo pure strategy Nash equilibria found.")
-        print("\nThis suggests the game may only have mixed strategy equilibria,")
-        print("which require probabilistic mixing over strategies.")
+        lines.append("\nNo pure strategy Nash equilibria found.")
+        lines.append("\nThis suggests the game may only have mixed strategy equilibria,")
+        lines.append("which require probabilistic mixing over strategies.")
     else:
-        print(f"\nFound {len(equilibria)} pure strategy Nash equilibrium/equilibria:\n")
+        lines.append(f"\nFound {len(equilibria)} pure strategy Nash equilibrium/equilibria:\n")
         
-        for i, eq in enumerate(equilibria, 1):
-            print(f"{'─' * 70}")
-            print(f"EQUILIBRIUM {i}")
-            print(f"{'─' * 70}")
-            print(f"  Player 1 (Opposition): {P1_LABELS[eq[0]]} (Strategy {eq[0]})")
-            print(f"  Player 2 (Regime):     {P2_LABELS[eq[1]]} (Strategy {eq[1]})")
-            print(f"  Player 3 (Israel):     {P3_LABELS[eq[2]]} (Strategy {eq[2]})")
-            print(f"\n  Payoffs:")
-            print(f"    Opposition: {payoffs_p1[eq]:.2f}")
-            print(f"    Regime:     {payoffs_p2[eq]:.2f}")
-            print(f"    Israel:     {payoffs_p3[eq]:.2f}")
-            print()
+        # Gather every equilibrium's payoffs in one vectorized lookup
+        game = ThreePlayerGame([payoffs_p1, payoffs_p2, payoffs_p3])
+        eq_payoffs = game.gather_payoffs(equilibria)
+        
+        for i, (eq, (pay1, pay2, pay3)) in enumerate(zip(equilibria, eq_payoffs), 1):
+            lines += [
+                f"{'─' * 70}",
+                f"EQUILIBRIUM {i}",
+                f"{'─' * 70}",
+                f"  Player 1 (Opposition): {P1_LABELS[eq[0]]} (Strategy {eq[0]})",
+                f"  Player 2 (Regime):     {P2_LABELS[eq[1]]} (Strategy {eq[1]})",
+                f"  Player 3 (Israel):     {P3_LABELS[eq[2]]} (Strategy {eq[2]})",
+                f"\n  Payoffs:",
+                f"    Opposition: {pay1:.2f}",
+                f"    Regime:     {pay2:.2f}",
+                f"    Israel:     {pay3:.2f}",
+                "",
+            ]
+    
+    print("\n".join(lines))
 
 
 def analyze_best_responses(game: ThreePlayerGame, 
                            payoffs_p1: np.ndarray, payoffs_p2: np.ndarray,
                            payoffs_p3: np.ndarray):
     """Analyze and display best response structure."""
-    print("\n" + "=" * 90)
-    print("BEST RESPONSE ANALYSIS")
-    print("=" * 90)
+    lines = ["\n" + "=" * 90, "BEST RESPONSE ANALYSIS", "=" * 90]
     
-    print("\nFor each player, showing best responses given others' strategies:\n")
+    lines.append("\nFor each player, showing best responses given others' strategies:\n")
     
     # Player 1 (Opposition) best responses
-    print("OPPOSITION best responses:")
+    lines.append("OPPOSITION best responses:")
     for p2 in range(4):
         for p3 in range(2):
             br = game.find_best_responses(0, (p2, p3))
-            br_labels = [P1_LABELS[b] for b in br]
-            print(f"  vs Regime={P2_SHORT_LABELS[p2]}, Israel={P3_LABELS[p3]}: {br_labels}")
+            lines.append(_OPP_BR_PREFIX[p2][p3] + str([P1_LABELS[b] for b in br]))
     
-    print("\nREGIME best responses:")
+    lines.append("\nREGIME best responses:")
     for p1 in range(2):
         for p3 in range(2):
             br = game.find_best_responses(1, (p1, p3))
-            br_labels = [P2_SHORT_LABELS[b] for b in br]
-            print(f"  vs Opposition={P1_LABELS[p1]}, Israel={P3_LABELS[p3]}: {br_labels}")
+            lines.append(_REG_BR_PREFIX[p1][p3] + str([P2_SHORT_LABELS[b] for b in br]))
     
-    print("\nISRAEL best responses:")
+    lines.append("\nISRAEL best responses:")
     for p1 in range(2):
         for p2 in range(4):
             br = game.find_best_responses(2, (p1, p2))
-            br_labels = [P3_LABELS[b] for b in br]
-            print(f"  vs Opposition={P1_LABELS[p1]}, Regime={P2_SHORT_LABELS[p2]}: {br_labels}")
+            lines.append(_ISR_BR_PREFIX[p1][p2] + str([P3_LABELS[b] for b in br]))
+    
+    print("\n".join(lines))
 
 
 def create_game_probability_csv(filepath: str, probabilities: Dict):
@@ -141,33 +151,49 @@ def create_game_probability_csv(filepath: str, probabilities: Dict):
         'computed_opp_payoff', 'computed_reg_payoff', 'computed_isr_payoff'
     ]
     
-    rows = []
-    for (p1, p2, p3), probs in sorted(probabilities.items()):
-        opp_probs = OppositionProbs(**probs['opposition'])
-        reg_probs = RegimeProbs(**probs['regime'])
-        isr_probs = IsraelProbs(**probs['israel'])
-        
-        row = {
-            'p1_strat': p1, 'p1_label': P1_LABELS[p1],
-            'p2_strat': p2, 'p2_label': P2_SHORT_LABELS[p2],
-            'p3_strat': p3, 'p3_label': P3_LABELS[p3],
-            **{f'opp_{k}': v for k, v in probs['opposition'].items()},
-            **{f'reg_{k}': v for k, v in probs['regime'].items()},
-            **{f'isr_{k}': v for k, v in probs['israel'].items()},
-            'computed_opp_payoff': f"{opposition_expected_payoff(opp_probs):.2f}",
-            'computed_reg_payoff': f"{regime_expected_payoff(reg_probs):.2f}",
-            'computed_isr_payoff': f"{israel_expected_payoff(isr_probs):.2f}",
-        }
-        rows.append(row)
+    cells = sorted(probabilities.items())
+    
+    # Expected payoffs for every cell in one vectorized pass
+    opp_mat = np.array([[probs['opposition'][k] for k in OPP_KEYS] for _, probs in cells])
+    reg_mat = np.array([[probs['regime'][k] for k in REG_KEYS] for _, probs in cells])
+    isr_mat = np.array([[probs['israel'][k] for k in ISR_KEYS] for _, probs in cells])
+    opp_pay, reg_pay, isr_pay = compute_payoff_vectors(
+        opp_mat.reshape(-1, len(OPP_KEYS)), reg_mat.reshape(-1, len(REG_KEYS)),
+        isr_mat.reshape(-1, len(ISR_KEYS))
+    )
+    
+    # Plain lists in header order; no per-row dicts or fieldname lookups
+    rows = [
+        [p1, P1_LABELS[p1], p2, P2_SHORT_LABELS[p2], p3, P3_LABELS[p3],
+         *[probs['opposition'][k] for k in OPP_KEYS],
+         *[probs['regime'][k] for k in REG_KEYS],
+         *[probs['israel'][k] for k in ISR_KEYS],
+         f"{opp_pay[i]:.2f}", f"{reg_pay[i]:.2f}", f"{isr_pay[i]:.2f}"]
+        for i, ((p1, p2, p3), probs) in enumerate(cells)
+    ]
     
     with open(filepath, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=header)
-        writer.writeheader()
+        writer = csv.writer(f)
+        writer.writerow(header)
         writer.writerows(rows)
     
     return filepath
 
 
+@lru_cache(maxsize=8)
+def _cached_payoff_tensor(path: str, mtime_ns: int, size: int, ino: int) -> np.ndarray:
+    """
+    Parse a probability CSV and compute its payoff tensor, memoized per
+    (path, mtime, size, inode); editing or replacing the file changes the
+    key and forces a reload. Size and inode catch rewrites within mtime
+    granularity and files swapped in with a preserved mtime (cp -p,
+    rsync -t). The tensor is read-only because it is shared between calls.
+    """
+    payoffs = compute_payoff_tensor(*load_arrays_from_csv(path))
+    payoffs.setflags(write=False)
+    return payoffs
+
+
 def run_game_from_csv(csv_path: str, scale: float = 10.0, verbose: bool = True):
     """
     Run the complete game analysis from a CSV file.
@@ -178,7 +204,8 @@ def run_game_from_csv(csv_path: str, scale: float = 10.0, verbose: bool = True):
         verbose: Whether to print detailed analysis
     
     Returns:
-        Tuple of (game, equilibria, payoffs)
+        Tuple of (game, equilibria, payoffs); payoffs are writable arrays
+        owned by the caller, never the cached tensor
     """
     print("\n" + "=" * 90)
     print("THREE-PLAYER GEOPOLITICAL GAME ANALYZER")
@@ -186,14 +213,16 @@ def run_game_from_csv(csv_path: str, scale: float = 10.0, verbose: bool = True):
     print(f"\nLoading probabilities from: {csv_path}")
     
     # Load and compute payoffs
-    probabilities = load_probabilities_from_csv(csv_path)
-    payoffs_p1, payoffs_p2, payoffs_p3 = compute_payoffs_from_probabilities(probabilities)
+    path = os.path.abspath(csv_path)
+    # The cached tensor is shared and read-only; take a private, writable
+    # copy (callers get it back) and rescale that in place
+    st = os.stat(path)
+    payoffs = _cached_payoff_tensor(path, st.st_mtime_ns, st.st_size, st.st_ino).copy()
     
     # Normalize to desired scale
     if scale != 100.0:
-        payoffs_p1, payoffs_p2, payoffs_p3 = normalize_payoffs(
-            payoffs_p1, payoffs_p2, payoffs_p3, scale=scale
-        )
+        normalize_payoffs(*payoffs, scale=scale, inplace=True)
+    payoffs_p1, payoffs_p2, payoffs_p3 = payoffs
     
     # Display payoff tables
     if verbose:
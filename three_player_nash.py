@@ -7,7 +7,34 @@ Finds pure strategy Nash equilibria by checking best response conditions.
 """
 
 import numpy as np
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
+
+
+# Payoffs within this of a player's best are treated as ties, so computed
+# payoffs that differ only by floating-point noise are all best responses.
+# Widened per game when the storage dtype cannot resolve it (see __init__)
+TIE_ATOL = 1e-9
+
+# Shape of the geopolitical game; gets a specialized equilibrium scan
+SHAPE_2X4X2 = (2, 4, 2)
+
+
+def _iter_eq_2x4x2(payoffs, thresholds) -> Iterator[Tuple[int, int, int]]:
+    """
+    Equilibrium scan specialized to the 2x4x2 shape on nested Python lists.
+    
+    thresholds[i] is player i's axis maximum minus the tie tolerance with that axis
+    dropped, so each of the 16 profiles costs three float compares and no
+    NumPy calls.
+    """
+    p1, p2, p3 = payoffs
+    t1, t2, t3 = thresholds
+    for i in (0, 1):
+        for j in (0, 1, 2, 3):
+            for k in (0, 1):
+                if (p1[i][j][k] >= t1[j][k] and p2[i][j][k] >= t2[i][k]
+                        and p3[i][j][k] >= t3[i][j]):
+                    yield (i, j, k)
 
 
 class ThreePlayerGame:
@@ -19,31 +46,86 @@ class ThreePlayerGame:
                  Shape is (n1, n2, n3) where ni is the number of strategies for player i.
     """
     
-    def __init__(self, payoffs: List[np.ndarray]):
+    def __init__(self, payoffs: List[np.ndarray], dtype: Optional[np.dtype] = None):
         """
         Initialize the game with payoff matrices.
         
         Args:
             payoffs: List of 3 numpy arrays [payoffs_p1, payoffs_p2, payoffs_p3]
                     Each array has shape (n1, n2, n3)
+            dtype: Optional storage dtype for the payoffs; None (default)
+                   keeps the inputs' dtype. np.float32 halves the memory
+                   scanned by best-response reductions, but payoffs closer
+                   than a few float32 ulps of the largest payoff then
+                   compare as ties, which can change the equilibria found.
         """
         if len(payoffs) != 3:
             raise ValueError("Must provide exactly 3 payoff matrices")
         
-        self.payoffs = [np.array(p) for p in payoffs]
-        self.shape = self.payoffs[0].shape
+        # np.stack below makes the only copy; caller arrays are never aliased
+        arrays = [np.asarray(p, dtype=dtype) for p in payoffs]
+        self.shape = arrays[0].shape
         
         # Verify all payoff matrices have the same shape
-        for i, p in enumerate(self.payoffs):
+        for i, p in enumerate(arrays):
             if p.shape != self.shape:
                 raise ValueError(f"Payoff matrix {i} has shape {p.shape}, expected {self.shape}")
         
         self.n_strategies = list(self.shape)
+        
+        # One contiguous (3, n1, n2, n3) block; self.payoffs[i] is a view of
+        # player i's cube. Read-only so the per-axis maxima never go stale
+        self._P = np.stack(arrays)
+        self._P.setflags(write=False)
+        self.payoffs = [self._P[i] for i in range(3)]
+        
+        # Each player's best payoff along their own axis, shape 1 on that axis.
+        # An empty axis has no maximum; p itself (also empty) keeps the
+        # masks below well-formed, so empty games have no equilibria
+        self._axis_max = [p.max(axis=i, keepdims=True) if p.shape[i] else p
+                          for i, p in enumerate(self.payoffs)]
+        
+        # TIE_ATOL, widened to a few ulps of the largest payoff when the
+        # storage dtype is too coarse for it (e.g. float32); otherwise
+        # m - TIE_ATOL would round back to m and the tolerance would vanish
+        self._tie_atol = TIE_ATOL
+        if np.issubdtype(self._P.dtype, np.floating) and self._P.size:
+            ulp = float(np.finfo(self._P.dtype).eps) * float(np.abs(self._P).max())
+            self._tie_atol = max(TIE_ATOL, 4.0 * ulp)
+        
+        # Payoff a profile must reach to be a best response, per player
+        self._thresholds = [m - self._tie_atol for m in self._axis_max]
+        
+        # Per-player best-response lookups, see _best_response_table
+        self._br_tables: List[Optional[List[List[List[int]]]]] = [None, None, None]
+        
+        # Plain-list copies for the fixed-shape scan in _iter_eq_2x4x2
+        self._lists_2x4x2 = None
+        if self.shape == SHAPE_2X4X2:
+            m1, m2, m3 = self._thresholds
+            self._lists_2x4x2 = (
+                [p.tolist() for p in self.payoffs],
+                [m1[0].tolist(), m2[:, 0].tolist(), m3[:, :, 0].tolist()],
+            )
     
     def get_payoff(self, player: int, strategy_profile: Tuple[int, int, int]) -> float:
         """Get payoff for a player given a strategy profile."""
         return self.payoffs[player][strategy_profile]
     
+    def gather_payoffs(self, profiles: np.ndarray) -> np.ndarray:
+        """
+        Gather all three players' payoffs for many strategy profiles at once.
+        
+        Args:
+            profiles: Integer array of shape (k, 3), one profile per row
+        
+        Returns:
+            Array of shape (k, 3); column i holds player i's payoffs
+        """
+        profiles = np.asarray(profiles, dtype=np.intp).reshape(-1, 3)
+        s1, s2, s3 = profiles.T
+        return self._P[:, s1, s2, s3].T
+    
     def is_best_response(self, player: int, strategy: int, 
                          other_strategies: Tuple[int, ...]) -> bool:
         """
@@ -57,28 +139,13 @@ class ThreePlayerGame:
         Returns:
             True if the strategy is a best response
         """
-        # Build the full strategy profile for comparison
-        if player == 0:
-            current_payoff = self.payoffs[0][strategy, other_strategies[0], other_strategies[1]]
-            # Check all alternative strategies for player 0
-            for alt_strat in range(self.n_strategies[0]):
-                alt_payoff = self.payoffs[0][alt_strat, other_strategies[0], other_strategies[1]]
-                if alt_payoff > current_payoff:
-                    return False
-        elif player == 1:
-            current_payoff = self.payoffs[1][other_strategies[0], strategy, other_strategies[1]]
-            for alt_strat in range(self.n_strategies[1]):
-                alt_payoff = self.payoffs[1][other_strategies[0], alt_strat, other_strategies[1]]
-                if alt_payoff > current_payoff:
-                    return False
-        else:  # player == 2
-            current_payoff = self.payoffs[2][other_strategies[0], other_strategies[1], strategy]
-            for alt_strat in range(self.n_strategies[2]):
-                alt_payoff = self.payoffs[2][other_strategies[0], other_strategies[1], alt_strat]
-                if alt_payoff > current_payoff:
-                    return False
+        profile = list(other_strategies)
+        profile.insert(player, strategy)
+        collapsed = list(profile)
+        collapsed[player] = 0
         
-        return True
+        best = self._axis_max[player][tuple(collapsed)]
+        return bool(self.payoffs[player][tuple(profile)] >= best - self._tie_atol)
     
     def is_nash_equilibrium(self, strategy_profile: Tuple[int, int, int]) -> bool:
         """
@@ -103,6 +170,26 @@ class ThreePlayerGame:
         
         return True
     
+    def iter_pure_nash_equilibria(self) -> Iterator[Tuple[int, int, int]]:
+        """
+        Yield pure strategy Nash equilibria one at a time, in lexicographic order.
+        
+        Callers that only need to know whether an equilibrium exists, or
+        want the first few, can stop early (e.g. next() or itertools.islice).
+        """
+        if self._lists_2x4x2 is not None:
+            yield from _iter_eq_2x4x2(*self._lists_2x4x2)
+            return
+        
+        # A profile is an equilibrium iff every player's payoff attains the
+        # maximum along that player's own axis (up to the tie tolerance)
+        mask = np.ones(self.shape, dtype=bool)
+        for p, t in zip(self.payoffs, self._thresholds):
+            mask &= p >= t
+        
+        for eq in np.argwhere(mask).tolist():
+            yield tuple(eq)
+    
     def find_pure_nash_equilibria(self) -> List[Tuple[int, int, int]]:
         """
         Find all pure strategy Nash equilibria.
@@ -110,15 +197,7 @@ class ThreePlayerGame:
         Returns:
             List of strategy profiles that are Nash equilibria
         """
-        equilibria = []
-        
-        for s1 in range(self.n_strategies[0]):
-            for s2 in range(self.n_strategies[1]):
-                for s3 in range(self.n_strategies[2]):
-                    if self.is_nash_equilibrium((s1, s2, s3)):
-                        equilibria.append((s1, s2, s3))
-        
-        return equilibria
+        return list(self.iter_pure_nash_equilibria())
     
     def find_best_responses(self, player: int, 
                             other_strategies: Tuple[int, ...]) -> List[int]:
@@ -126,26 +205,27 @@ class ThreePlayerGame:
         Find all best responses for a player given others' strategies.
         
         Returns:
-            List of strategies that are best responses
-        """
-        best_payoff = float('-inf')
-        best_responses = []
-        
-        for strat in range(self.n_strategies[player]):
-            if player == 0:
-                payoff = self.payoffs[0][strat, other_strategies[0], other_strategies[1]]
-            elif player == 1:
-                payoff = self.payoffs[1][other_strategies[0], strat, other_strategies[1]]
-            else:
-                payoff = self.payoffs[2][other_strategies[0], other_strategies[1], strat]
-            
-            if payoff > best_payoff:
-                best_payoff = payoff
-                best_responses = [strat]
-            elif payoff == best_payoff:
-                best_responses.append(strat)
-        
-        return best_responses
+            List of strategies that are best responses (within the tie
+            tolerance of the best payoff, TIE_ATOL for float64 payoffs)
+        """
+        a, b = other_strategies
+        return list(self._best_response_table(player)[a][b])
+    
+    def _best_response_table(self, player: int) -> List[List[List[int]]]:
+        """
+        Nested lists indexed by the other two players' strategies, each
+        holding player's best responses; built on first use from the
+        thresholds set in __init__, then every lookup is two list subscripts.
+        """
+        table = self._br_tables[player]
+        if table is None:
+            mask = self.payoffs[player] >= self._thresholds[player]
+            # Move player's own axis last (transpose is cheaper than moveaxis)
+            axes = [i for i in range(3) if i != player] + [player]
+            table = [[[s for s, ok in enumerate(cell) if ok] for cell in row]
+                     for row in mask.transpose(axes).tolist()]
+            self._br_tables[player] = table
+        return table
     
     def display_payoff_tables(self, 
                               p1_labels: Optional[List[str]] = None,
@@ -160,27 +240,26 @@ class ThreePlayerGame:
         p2_labels = p2_labels or [f"S{i}" for i in range(self.n_strategies[1])]
         p3_labels = p3_labels or [f"S{i}" for i in range(self.n_strategies[2])]
         
+        # Header is the same for every Player 3 strategy
+        header = f"{'P1/P2':<15}" + "".join(
+            f"{p2_labels[p2_idx]:<18}" for p2_idx in range(self.n_strategies[1])
+        )
+        
+        # [p3][p1][p2] -> (p1_pay, p2_pay, p3_pay) as plain lists, built once
+        cells = self._P.transpose(3, 1, 2, 0).tolist()
+        
         for p3_idx in range(self.n_strategies[2]):
             output.append(f"\n{'='*80}")
             output.append(f"Player 3: {p3_labels[p3_idx]}")
             output.append("="*80)
-            
-            # Header
-            header = f"{'P1/P2':<15}"
-            for p2_idx in range(self.n_strategies[1]):
-                header += f"{p2_labels[p2_idx]:<18}"
             output.append(header)
             output.append("-" * 80)
             
             # Rows
             for p1_idx in range(self.n_strategies[0]):
-                row = f"{p1_labels[p1_idx]:<15}"
-                for p2_idx in range(self.n_strategies[1]):
-                    p1_pay = self.payoffs[0][p1_idx, p2_idx, p3_idx]
-                    p2_pay = self.payoffs[1][p1_idx, p2_idx, p3_idx]
-                    p3_pay = self.payoffs[2][p1_idx, p2_idx, p3_idx]
-                    row += f"({p1_pay:>5.2f},{p2_pay:>5.2f},{p3_pay:>5.2f}) "
-                output.append(row)
+                output.append(f"{p1_labels[p1_idx]:<15}" + "".join(
+                    f"({a:>5.2f},{b:>5.2f},{c:>5.2f}) " for a, b, c in cells[p3_idx][p1_idx]
+                ))
         
         return "\n".join(output)
 